@@ -29,25 +29,24 @@ def main() -> None:
     args = parse_args()
     config = ControlPlaneConfig.load(Path(args.config))
     audit_logger = JsonAuditLogger()
-    manager = TenantManager(config, audit_logger=audit_logger)
-
-    if args.operation == "list-users":
-        result = manager.run_operation(
-            tenant_id=args.tenant_id,
-            operation=lambda ops: ops.list_users(top=args.top),
-        )
-    elif args.operation == "create-security-group":
-        if not args.group_name or not args.group_description:
-            raise SystemExit("--group-name and --group-description are required for group creation")
-        result = manager.run_operation(
-            tenant_id=args.tenant_id,
-            operation=lambda ops: ops.create_security_group(
-                display_name=args.group_name,
-                description=args.group_description,
-            ),
-        )
-    else:
-        raise SystemExit(f"Unsupported operation: {args.operation}")
+    with TenantManager(config, audit_logger=audit_logger) as manager:
+        if args.operation == "list-users":
+            result = manager.run_operation(
+                tenant_id=args.tenant_id,
+                operation=lambda ops: ops.list_users(top=args.top),
+            )
+        elif args.operation == "create-security-group":
+            if not args.group_name or not args.group_description:
+                raise SystemExit("--group-name and --group-description are required for group creation")
+            result = manager.run_operation(
+                tenant_id=args.tenant_id,
+                operation=lambda ops: ops.create_security_group(
+                    display_name=args.group_name,
+                    description=args.group_description,
+                ),
+            )
+        else:
+            raise SystemExit(f"Unsupported operation: {args.operation}")
 
     print(json.dumps(result, indent=2))
 
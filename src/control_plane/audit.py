@@ -6,11 +6,32 @@ import sys
 from collections import deque
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
-from threading import Lock
+from itertools import islice
 from typing import Any, Deque, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+
+def json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+_LEVEL_NAMES: Dict[int, str] = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+
+@dataclass(slots=True)
 class AuditEvent:
     timestamp: str
     level: str
@@ -21,19 +42,21 @@ class AuditEvent:
 
 
 class InMemoryAuditStore:
-    """Thread-safe audit event buffer for reporting and UI consumption."""
+    """Thread-safe audit event buffer for reporting and UI consumption.
+
+    No explicit lock is taken: ``deque.appendleft`` on a bounded deque is atomic,
+    and ``list(islice(...))`` copies the newest events in a single C-level call, so
+    readers always see a consistent snapshot without contending with writers.
+    """
 
     def __init__(self, max_events: int = 1000):
         self._events: Deque[AuditEvent] = deque(maxlen=max_events)
-        self._lock = Lock()
 
     def append(self, event: AuditEvent) -> None:
-        with self._lock:
-            self._events.appendleft(event)
+        self._events.appendleft(event)
 
     def list(self, limit: int = 100) -> List[AuditEvent]:
-        with self._lock:
-            return list(list(self._events)[:limit])
+        return list(islice(self._events, max(limit, 0)))
 
 
 class JsonAuditLogger:
@@ -59,10 +82,13 @@ class JsonAuditLogger:
         self.store = store
 
     def _log(self, level: int, message: str, **kwargs: Any) -> None:
+        if self.store is None and not self.logger.isEnabledFor(level):
+            return
         event = self._build_event(level, message, **kwargs)
-        if self.store:
+        if self.store is not None:
             self.store.append(event)
-        self.logger.log(level, message, extra={"extra": kwargs})
+        # Hand the event timestamp to the formatter so it is only computed once.
+        self.logger.log(level, message, extra={"extra": kwargs, "audit_timestamp": event.timestamp})
 
     def info(self, message: str, **kwargs: Any) -> None:
         self._log(logging.INFO, message, **kwargs)
@@ -76,7 +102,7 @@ class JsonAuditLogger:
     def _build_event(self, level: int, message: str, **kwargs: Any) -> AuditEvent:
         return AuditEvent(
             timestamp=datetime.now(timezone.utc).isoformat(),
-            level=logging.getLevelName(level),
+            level=_LEVEL_NAMES.get(level) or logging.getLevelName(level),
             message=message,
             tenant_id=kwargs.get("tenant_id"),
             correlation_id=kwargs.get("correlation_id"),
@@ -86,8 +112,9 @@ class JsonAuditLogger:
 
 class _JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
+        timestamp: Optional[str] = getattr(record, "audit_timestamp", None)
         payload: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "message": record.getMessage(),
         }
@@ -96,4 +123,4 @@ class _JsonFormatter(logging.Formatter):
         if extra:
             payload.update(extra)
 
-        return json.dumps(payload)
+        return json_dumps(payload)
@@ -1,84 +1,164 @@
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
 import json
 import logging
+import re
+import time
 from pathlib import Path
-from typing import Iterable, List
-
-import httpx
-import msal
-from azure.identity import ManagedIdentityCredential
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from .config import CertificateAuth, ClientSecretAuth, ManagedIdentityAuth, TenantConfig
 from .audit import JsonAuditLogger
 
+if TYPE_CHECKING:
+    # msal and azure-identity are slow to import, so they are only loaded by the
+    # auth flow that needs them.
+    import msal
+    from azure.identity import ManagedIdentityCredential
+
 logger = logging.getLogger(__name__)
 
+# Tokens are reused until they are this close to expiry.
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Process-wide caches partitioned by tenant so every tenant keeps its own MSAL
+# application (and therefore its own MSAL token cache) and bearer tokens. Each
+# application is stored with a fingerprint of the authority and credential it was
+# built from, so a rotated secret or certificate replaces it.
+_AppKey = Tuple[str, str, Optional[str]]
+_TokenKey = Tuple[str, str, Optional[str], FrozenSet[str]]
+_APP_CACHE: Dict[_AppKey, Tuple[str, msal.ConfidentialClientApplication]] = {}
+_CREDENTIAL_CACHE: Dict[_AppKey, ManagedIdentityCredential] = {}
+_TOKEN_CACHE: Dict[_TokenKey, Tuple[str, float]] = {}
+# _CACHE_LOCK only guards _KEY_LOCKS. Building an app or credential may hit the
+# network, so it happens under the per-key lock and tenants never wait on each other.
+_CACHE_LOCK = Lock()
+_KEY_LOCKS: Dict[_AppKey, Lock] = {}
+
+_PEM_CERTIFICATE = re.compile(
+    rb"-----BEGIN CERTIFICATE-----(.+?)-----END CERTIFICATE-----", re.DOTALL
+)
+
 
 class GraphAuthenticator:
     """Handles token acquisition for Microsoft Graph across tenants.
 
-    Supports client secret, certificate-based auth, and managed identities. Tokens are
-    cached in memory by MSAL for confidentiality flows; managed identity relies on the
-    platform cache.
+    Supports client secret, certificate-based auth, and managed identities. MSAL
+    applications and managed identity credentials are created once per tenant and
+    credential and reused, and bearer tokens are served from memory until they are within
+    ``TOKEN_REFRESH_MARGIN_SECONDS`` of expiry.
     """
 
     def __init__(self, tenant_config: TenantConfig, audit_logger: JsonAuditLogger):
         self.tenant_config = tenant_config
         self.audit = audit_logger
 
-    def acquire_token(self, scopes: Iterable[str]) -> str:
+    def acquire_token(self, scopes: Iterable[str], force_refresh: bool = False) -> str:
+        """Return a bearer token for ``scopes``.
+
+        ``force_refresh`` bypasses cached tokens, e.g. after Graph rejected one
+        with a 401. It also rebuilds the MSAL application or managed identity
+        credential so their internal token caches are bypassed too.
+        """
         auth_config = self.tenant_config.auth
+        scopes = list(scopes)
+        app_key: _AppKey = (self.tenant_config.tenant_id, auth_config.type, auth_config.client_id)
+        token_key: _TokenKey = (*app_key, frozenset(scopes))
+
+        cached = _TOKEN_CACHE.get(token_key)
+        if not force_refresh and cached and cached[1] - time.time() > TOKEN_REFRESH_MARGIN_SECONDS:
+            return cached[0]
 
         if isinstance(auth_config, ClientSecretAuth):
-            app = msal.ConfidentialClientApplication(
-                client_id=auth_config.client_id,
-                client_credential=auth_config.client_secret.resolve(),
-                authority=f"{auth_config.authority_host}/{self.tenant_config.tenant_id}",
-                token_cache=msal.TokenCache(),
+            secret = auth_config.client_secret.resolve()
+            app = self._get_confidential_app(
+                app_key,
+                credential_id=hashlib.blake2b(secret.encode(), digest_size=16).hexdigest(),
+                load_credential=lambda: secret,
+                force_new=force_refresh,
             )
-            result = app.acquire_token_silent(list(scopes), account=None)
-            if not result:
-                result = app.acquire_token_for_client(scopes=list(scopes))
-            token = self._extract_token(result)
-            self.audit.info(
-                "acquired_app_token",
-                tenant_id=self.tenant_config.tenant_id,
-                auth_type="client_secret",
+            token, expires_at = self._acquire_app_token(app, scopes, force_refresh)
+        elif isinstance(auth_config, CertificateAuth):
+            cert_path = Path(auth_config.certificate_path)
+            try:
+                mtime_ns = cert_path.stat().st_mtime_ns
+            except OSError as exc:
+                raise RuntimeError(f"Failed to read certificate at {cert_path}: {exc}") from exc
+            app = self._get_confidential_app(
+                app_key,
+                credential_id=f"{cert_path}:{mtime_ns}",
+                load_credential=lambda: self._load_certificate(cert_path, mtime_ns),
+                force_new=force_refresh,
             )
-            return token
+            token, expires_at = self._acquire_app_token(app, scopes, force_refresh)
+        elif isinstance(auth_config, ManagedIdentityAuth):
+            with _key_lock(app_key):
+                credential = _CREDENTIAL_CACHE.get(app_key)
+                # ManagedIdentityCredential.get_token has no way to bypass its own
+                # token cache, so a forced refresh starts from a new credential.
+                if credential is None or force_refresh:
+                    from azure.identity import ManagedIdentityCredential
+
+                    credential = ManagedIdentityCredential(client_id=auth_config.client_id)
+                    _CREDENTIAL_CACHE[app_key] = credential
+            result = credential.get_token(*scopes)
+            token, expires_at = result.token, float(result.expires_on)
+        else:
+            raise ValueError("Unsupported authentication configuration")
+
+        _TOKEN_CACHE[token_key] = (token, expires_at)
+        self.audit.info(
+            "acquired_app_token",
+            tenant_id=self.tenant_config.tenant_id,
+            auth_type=auth_config.type,
+        )
+        return token
+
+    def _get_confidential_app(
+        self,
+        key: _AppKey,
+        credential_id: str,
+        load_credential: Callable[[], Union[str, Dict[str, Any]]],
+        force_new: bool = False,
+    ) -> msal.ConfidentialClientApplication:
+        """Return the tenant's MSAL application, creating it when needed.
+
+        The application is reused, so MSAL's internal token cache survives between
+        calls, as long as the authority and ``credential_id`` are unchanged and
+        ``force_new`` is not set.
+        """
+        auth_config = self.tenant_config.auth
+        authority = f"{auth_config.authority_host}/{self.tenant_config.tenant_id}"
+        source = f"{authority}|{credential_id}"
+        with _key_lock(key):
+            cached = _APP_CACHE.get(key)
+            if cached and cached[0] == source and not force_new:
+                return cached[1]
+
+            import msal
 
-        if isinstance(auth_config, CertificateAuth):
-            cert_path = Path(auth_config.certificate_path)
-            certificate = self._load_certificate(cert_path)
             app = msal.ConfidentialClientApplication(
                 client_id=auth_config.client_id,
-                client_credential=certificate,
-                authority=f"{auth_config.authority_host}/{self.tenant_config.tenant_id}",
-                token_cache=msal.TokenCache(),
-            )
-            result = app.acquire_token_silent(list(scopes), account=None)
-            if not result:
-                result = app.acquire_token_for_client(scopes=list(scopes))
-            token = self._extract_token(result)
-            self.audit.info(
-                "acquired_app_token",
-                tenant_id=self.tenant_config.tenant_id,
-                auth_type="certificate",
+                client_credential=load_credential(),
+                authority=authority,
             )
-            return token
-
-        if isinstance(auth_config, ManagedIdentityAuth):
-            credential = ManagedIdentityCredential(client_id=auth_config.client_id)
-            result = credential.get_token(*scopes)
-            self.audit.info(
-                "acquired_app_token",
-                tenant_id=self.tenant_config.tenant_id,
-                auth_type="managed_identity",
-            )
-            return result.token
-
-        raise ValueError("Unsupported authentication configuration")
+            _APP_CACHE[key] = (source, app)
+        return app
+
+    def _acquire_app_token(
+        self, app: msal.ConfidentialClientApplication, scopes: List[str], force_refresh: bool
+    ) -> Tuple[str, float]:
+        result = None
+        if not force_refresh:
+            result = app.acquire_token_silent(scopes, account=None)
+        if not result:
+            result = app.acquire_token_for_client(scopes=scopes)
+        token = self._extract_token(result)
+        return token, time.time() + float(result.get("expires_in", 0))
 
     @staticmethod
     def _extract_token(result: dict) -> str:
@@ -86,15 +166,47 @@ class GraphAuthenticator:
             raise RuntimeError(f"Token acquisition failed: {json.dumps(result)}")
         return result["access_token"]
 
-    def _load_certificate(self, path: Path) -> dict:
+    def _load_certificate(self, path: Path, mtime_ns: int) -> dict:
         password = None
         auth_config = self.tenant_config.auth
         if isinstance(auth_config, CertificateAuth) and auth_config.certificate_password:
             password = auth_config.certificate_password.resolve()
         try:
-            with path.open("rb") as handle:
-                certificate_bytes = handle.read()
+            certificate_bytes, thumbprint = _read_certificate(str(path), mtime_ns)
         except OSError as exc:
             raise RuntimeError(f"Failed to read certificate at {path}: {exc}") from exc
+        if thumbprint is None:
+            raise RuntimeError(
+                f"Certificate at {path} must be a PEM file containing the private key and "
+                "its public certificate; PFX and key-only files are not supported"
+            )
 
-        return {"private_key": certificate_bytes, "thumbprint": None, "passphrase": password}
+        return {"private_key": certificate_bytes, "thumbprint": thumbprint, "passphrase": password}
+
+
+def _key_lock(key: _AppKey) -> Lock:
+    with _CACHE_LOCK:
+        lock = _KEY_LOCKS.get(key)
+        if lock is None:
+            lock = _KEY_LOCKS[key] = Lock()
+    return lock
+
+
+@functools.lru_cache(maxsize=32)
+def _read_certificate(path: str, mtime_ns: int) -> Tuple[bytes, Optional[str]]:
+    """Read certificate material and its SHA-1 thumbprint.
+
+    Cached by path and modification time. The modification time is also part of
+    the MSAL application cache key, so replacing the file rebuilds the application
+    with the new certificate. The thumbprint is only available for PEM files that
+    embed the public certificate.
+    """
+    with open(path, "rb") as handle:
+        certificate_bytes = handle.read()
+
+    thumbprint = None
+    match = _PEM_CERTIFICATE.search(certificate_bytes)
+    if match:
+        certificate_der = base64.b64decode(b"".join(match.group(1).split()))
+        thumbprint = hashlib.sha1(certificate_der).hexdigest().upper()
+    return certificate_bytes, thumbprint
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
@@ -94,7 +94,7 @@ AuthConfig = Union[ClientSecretAuth, CertificateAuth, ManagedIdentityAuth]
 class TenantConfig(BaseModel):
     tenant_id: str
     display_name: Optional[str] = None
-    auth: AuthConfig
+    auth: AuthConfig = Field(discriminator="type")
     default_scopes: List[str] = Field(
         default_factory=lambda: ["https://graph.microsoft.com/.default"]
     )
@@ -128,11 +128,49 @@ class ControlPlaneConfig(BaseModel):
 
     @classmethod
     def load(cls, path: Union[str, Path]) -> "ControlPlaneConfig":
-        config_path = Path(path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with config_path.open("r", encoding="utf-8") as handle:
-            raw = yaml.safe_load(handle) or {}
+        """Load and validate a configuration file.
 
-        return cls(**raw)
+        Parsed configurations are memoized by resolved path, modification time and
+        size, so loading an unchanged file again returns the cached instance. When
+        only the file metadata changed (e.g. the file was touched or rewritten with
+        identical content), a digest of the bytes avoids re-validating it.
+        """
+        config_path = Path(path)
+        try:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+        cache_key = str(config_path.resolve())
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached[2]
+
+        data = config_path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if cached and cached[1] == digest:
+            config = cached[2]
+        else:
+            raw = _parse_yaml(data)
+            config = cls(**raw)
+        _CONFIG_CACHE[cache_key] = (signature, digest, config)
+        return config
+
+
+def _parse_yaml(data: bytes) -> Any:
+    # Imported lazily so callers that never load a file do not pay for PyYAML.
+    import yaml
+
+    try:  # Prefer the libyaml-backed loader when PyYAML was built with it.
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeLoader as Loader  # type: ignore[assignment]
+
+    return yaml.load(data, Loader=Loader) or {}
+
+
+# Resolved config path -> ((st_mtime_ns, st_size), content digest, parsed config).
+# Storing the signature alongside the value means a changed file simply replaces
+# its entry.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], bytes, ControlPlaneConfig]] = {}
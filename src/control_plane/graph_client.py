@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import math
+import random
 import time
-from typing import Any, Dict, Iterable, Optional
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, NoReturn, Optional, Tuple
 
 import httpx
 
@@ -12,9 +19,30 @@ from .config import TenantConfig
 
 logger = logging.getLogger(__name__)
 
+_RETRYABLE_STATUS_CODES = (429, 503, 504)
+
+# Steps returned by GraphClient._next_step.
+_SUCCEEDED = "succeeded"
+_FAILED = "failed"
+_REFRESH_TOKEN = "refresh_token"
+_RETRY = "retry"
+
+
+@dataclass
+class _RetryState:
+    """Retry bookkeeping for a single Graph request."""
+
+    attempt: int = 1
+    backoff: float = 1.0
+    refreshed_token: bool = False
+
 
 class GraphClient:
-    """Tenant-scoped Microsoft Graph client with retry and logging."""
+    """Tenant-scoped Microsoft Graph client with retry and logging.
+
+    ``request``/``get``/``post`` are blocking; ``arequest``/``aget``/``apost`` are
+    their asyncio counterparts and share the same retry and audit behaviour.
+    """
 
     def __init__(
         self,
@@ -23,18 +51,33 @@ class GraphClient:
         audit_logger: JsonAuditLogger,
         timeout: float = 30.0,
         max_retries: int = 3,
+        session: Optional[httpx.Client] = None,
+        async_session: Optional[httpx.AsyncClient] = None,
     ):
         self.tenant_config = tenant_config
         self.authenticator = authenticator
         self.audit = audit_logger
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = httpx.Client(timeout=self.timeout)
+        # Prefer a shared, pooled client so connections are reused across calls.
+        self.session = session or httpx.Client(timeout=self.timeout)
+        # Only set for clients returned by with_async_session().
+        self.async_session = async_session
 
-    def _auth_header(self, scopes: Iterable[str]) -> Dict[str, str]:
-        token = self.authenticator.acquire_token(scopes)
+    def _auth_header(self, scopes: Iterable[str], force_refresh: bool = False) -> Dict[str, str]:
+        token = self.authenticator.acquire_token(scopes, force_refresh=force_refresh)
         return {"Authorization": f"Bearer {token}"}
 
+    def with_async_session(self, session: httpx.AsyncClient) -> "GraphClient":
+        """Return a copy of this client that sends async requests through ``session``.
+
+        httpx async clients are bound to the event loop that first uses them, so the
+        caller owns ``session`` and closes it when its loop is done.
+        """
+        client = copy.copy(self)
+        client.async_session = session
+        return client
+
     def request(
         self,
         method: str,
@@ -42,44 +85,104 @@ class GraphClient:
         scopes: Optional[Iterable[str]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
-        scopes = scopes or self.tenant_config.default_scopes
+        scopes = scopes or tuple(self.tenant_config.default_scopes)
         headers = kwargs.pop("headers", {})
         headers.update(self._auth_header(scopes))
-        backoff = 1.0
+        state = _RetryState()
 
-        for attempt in range(1, self.max_retries + 2):
+        while True:
             response = self.session.request(method, url, headers=headers, **kwargs)
-            if response.status_code in (429, 503, 504):
-                retry_after = self._get_retry_after_seconds(response) or backoff
-                self.audit.warning(
-                    "graph_throttled",
-                    tenant_id=self.tenant_config.tenant_id,
-                    status=response.status_code,
-                    retry_after=retry_after,
-                    attempt=attempt,
-                )
-                time.sleep(retry_after)
-                backoff = min(backoff * 2, 30)
-                continue
-
-            if response.status_code >= 400:
-                self.audit.error(
-                    "graph_request_failed",
-                    tenant_id=self.tenant_config.tenant_id,
-                    status=response.status_code,
-                    url=url,
-                    body=response.text,
-                )
-                response.raise_for_status()
-
-            self.audit.info(
-                "graph_request_succeeded",
-                tenant_id=self.tenant_config.tenant_id,
-                status=response.status_code,
-                url=url,
-            )
-            return response
-
+            step, delay = self._next_step(state, response)
+            if step == _SUCCEEDED:
+                return self._succeeded(response, url)
+            if step == _FAILED:
+                self._failed(response, url)
+            if step == _REFRESH_TOKEN:
+                headers.update(self._auth_header(scopes, force_refresh=True))
+            else:
+                time.sleep(delay)
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        scopes: Optional[Iterable[str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        if self.async_session is None:
+            raise RuntimeError("GraphClient has no async session; see with_async_session()")
+        scopes = scopes or tuple(self.tenant_config.default_scopes)
+        headers = kwargs.pop("headers", {})
+        # Token acquisition may block on the identity provider, so keep it off the loop.
+        headers.update(await asyncio.to_thread(self._auth_header, scopes))
+        state = _RetryState()
+
+        while True:
+            response = await self.async_session.request(method, url, headers=headers, **kwargs)
+            step, delay = self._next_step(state, response)
+            if step == _SUCCEEDED:
+                return self._succeeded(response, url)
+            if step == _FAILED:
+                self._failed(response, url)
+            if step == _REFRESH_TOKEN:
+                headers.update(await asyncio.to_thread(self._auth_header, scopes, True))
+            else:
+                await asyncio.sleep(delay)
+
+    def _next_step(self, state: _RetryState, response: httpx.Response) -> Tuple[str, float]:
+        """Decide how ``request``/``arequest`` proceed after ``response``.
+
+        Returns the step to take and, for ``_RETRY``, how long to wait first.
+        """
+        if response.status_code == 401 and not state.refreshed_token:
+            # The cached token may have been revoked or expired mid-retry. The
+            # single retry with a fresh token does not count against max_retries.
+            state.refreshed_token = True
+            return _REFRESH_TOKEN, 0.0
+
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            if state.attempt > self.max_retries:
+                return _FAILED, 0.0
+            delay = self._throttle_delay(response, state.backoff, state.attempt)
+            state.backoff = min(state.backoff * 2, 30)
+            state.attempt += 1
+            return _RETRY, delay
+
+        if response.status_code >= 400:
+            return _FAILED, 0.0
+        return _SUCCEEDED, 0.0
+
+    def _throttle_delay(self, response: httpx.Response, backoff: float, attempt: int) -> float:
+        retry_after = self._get_retry_after_seconds(response) or backoff
+        # Jitter keeps concurrent workers from retrying in lockstep.
+        retry_after += random.uniform(0, min(retry_after * 0.25, 5))
+        self.audit.warning(
+            "graph_throttled",
+            tenant_id=self.tenant_config.tenant_id,
+            status=response.status_code,
+            retry_after=retry_after,
+            attempt=attempt,
+        )
+        return retry_after
+
+    def _succeeded(self, response: httpx.Response, url: str) -> httpx.Response:
+        self.audit.info(
+            "graph_request_succeeded",
+            tenant_id=self.tenant_config.tenant_id,
+            status=response.status_code,
+            url=url,
+        )
+        return response
+
+    def _failed(self, response: httpx.Response, url: str) -> NoReturn:
+        self.audit.error(
+            "graph_request_failed",
+            tenant_id=self.tenant_config.tenant_id,
+            status=response.status_code,
+            url=url,
+            body=response.text,
+        )
+        response.raise_for_status()
         raise RuntimeError("Maximum retry attempts exceeded for Graph request")
 
     def _get_retry_after_seconds(self, response: httpx.Response) -> Optional[float]:
@@ -87,9 +190,20 @@ class GraphClient:
         if retry_after is None:
             return None
         try:
-            return float(retry_after)
+            seconds = float(retry_after)
         except ValueError:
+            pass
+        else:
+            # Negative, infinite or NaN values are malformed; fall back to backoff.
+            return seconds if math.isfinite(seconds) and seconds >= 0 else None
+        # Retry-After may also be an HTTP-date (RFC 7231 section 7.1.3).
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
             return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
     def get(self, path: str, **kwargs: Any) -> httpx.Response:
         url = f"{self.tenant_config.graph_base_url}{path}"
@@ -98,3 +212,11 @@ class GraphClient:
     def post(self, path: str, json: Any, **kwargs: Any) -> httpx.Response:
         url = f"{self.tenant_config.graph_base_url}{path}"
         return self.request("POST", url, json=json, **kwargs)
+
+    async def aget(self, path: str, **kwargs: Any) -> httpx.Response:
+        url = f"{self.tenant_config.graph_base_url}{path}"
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, path: str, json: Any, **kwargs: Any) -> httpx.Response:
+        url = f"{self.tenant_config.graph_base_url}{path}"
+        return await self.arequest("POST", url, json=json, **kwargs)
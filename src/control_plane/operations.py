@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
 
 from .graph_client import GraphClient
 
+# Largest $top Graph accepts on /users; bigger requests are served by paging.
+MAX_USERS_PAGE_SIZE = 999
+
 
 @dataclass
 class TenantExecutionContext:
@@ -18,10 +25,48 @@ class TenantOperations:
     def __init__(self, context: TenantExecutionContext):
         self.context = context
 
+    def iter_users(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield users page by page, following ``@odata.nextLink``.
+
+        Only one page of results is held in memory at a time. ``page_size`` is
+        capped at ``MAX_USERS_PAGE_SIZE``.
+        """
+        page_size = min(page_size, MAX_USERS_PAGE_SIZE)
+        response = self.context.graph.get("/v1.0/users", params={"$top": page_size})
+        while True:
+            users, next_link = _read_page(response)
+            yield from users
+            if not next_link:
+                return
+            response = self.context.graph.request("GET", next_link)
+
+    async def aiter_users(self, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of ``iter_users``."""
+        page_size = min(page_size, MAX_USERS_PAGE_SIZE)
+        response = await self.context.graph.aget("/v1.0/users", params={"$top": page_size})
+        while True:
+            users, next_link = _read_page(response)
+            for user in users:
+                yield user
+            if not next_link:
+                return
+            response = await self.context.graph.arequest("GET", next_link)
+
     def list_users(self, top: int = 10) -> List[Dict[str, Any]]:
-        response = self.context.graph.get(f"/v1.0/users?$top={top}")
-        data = response.json()
-        return data.get("value", [])
+        if top <= 0:
+            return []
+        return list(islice(self.iter_users(page_size=top), top))
+
+    async def list_users_async(self, top: int = 10) -> List[Dict[str, Any]]:
+        users: List[Dict[str, Any]] = []
+        if top <= 0:
+            return users
+        async with aclosing(self.aiter_users(page_size=top)) as pages:
+            async for user in pages:
+                users.append(user)
+                if len(users) >= top:
+                    break
+        return users
 
     def create_security_group(self, display_name: str, description: str) -> Dict[str, Any]:
         payload = {
@@ -33,3 +78,9 @@ class TenantOperations:
         }
         response = self.context.graph.post("/v1.0/groups", json=payload)
         return response.json()
+
+
+def _read_page(response: httpx.Response) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Split a Graph collection response into its items and ``@odata.nextLink``."""
+    data = response.json()
+    return data.get("value", []), data.get("@odata.nextLink")
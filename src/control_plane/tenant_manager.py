@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import uuid
-from typing import Callable, Dict, Iterable, Optional
+import secrets
+import weakref
+from dataclasses import replace
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import httpx
 
 from .audit import JsonAuditLogger
 from .auth import GraphAuthenticator
@@ -12,14 +17,45 @@ from .operations import TenantExecutionContext, TenantOperations
 
 logger = logging.getLogger(__name__)
 
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
 
 class TenantManager:
     """Central orchestrator for tenant onboarding, validation, and operations."""
 
-    def __init__(self, config: ControlPlaneConfig, audit_logger: Optional[JsonAuditLogger] = None):
+    def __init__(
+        self,
+        config: ControlPlaneConfig,
+        audit_logger: Optional[JsonAuditLogger] = None,
+        timeout: float = 30.0,
+    ):
         self.config = config
+        self.timeout = timeout
         self.audit = audit_logger or JsonAuditLogger()
         self._tenant_cache: Dict[str, TenantConfig] = {tenant.tenant_id: tenant for tenant in config.tenants}
+        self._context_cache: Dict[str, TenantExecutionContext] = {}
+        # One pooled HTTP/2 client shared by every tenant context so keep-alive
+        # connections to Graph are reused instead of re-handshaking per operation.
+        # Requests remain tenant-scoped because each carries its own bearer token.
+        self.http = httpx.Client(http2=True, timeout=timeout, limits=_HTTP_LIMITS)
+        # Closes the pool when the manager is garbage collected or at interpreter
+        # exit, without keeping the manager alive the way atexit.register would.
+        self._finalizer = weakref.finalize(self, self.http.close)
+
+    def __enter__(self) -> "TenantManager":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections held by the manager."""
+        self._finalizer()
+
+    def _async_http(self) -> httpx.AsyncClient:
+        # Async clients are bound to the event loop that first uses them, so one is
+        # created per async run rather than kept on the manager.
+        return httpx.AsyncClient(http2=True, timeout=self.timeout, limits=_HTTP_LIMITS)
 
     def get_tenant(self, tenant_id: str) -> TenantConfig:
         tenant = self._tenant_cache.get(tenant_id)
@@ -29,10 +65,12 @@ class TenantManager:
 
     def onboard_tenant(self, tenant: TenantConfig) -> None:
         self._tenant_cache[tenant.tenant_id] = tenant
+        self._context_cache.pop(tenant.tenant_id, None)
         self.audit.info("tenant_onboarded", tenant_id=tenant.tenant_id, display_name=tenant.display_name)
 
     def offboard_tenant(self, tenant_id: str) -> None:
         self._tenant_cache.pop(tenant_id, None)
+        self._context_cache.pop(tenant_id, None)
         self.audit.info("tenant_offboarded", tenant_id=tenant_id)
 
     def validate_permissions(self, tenant: TenantConfig) -> None:
@@ -45,11 +83,28 @@ class TenantManager:
         )
 
     def with_context(self, tenant_id: str) -> TenantExecutionContext:
+        """Return the execution context for a tenant, building it on first use.
+
+        Contexts are cached per tenant until the tenant is onboarded again or
+        offboarded, so permission validation runs once per context rather than on
+        every operation.
+        """
+        context = self._context_cache.get(tenant_id)
+        if context is not None:
+            return context
+
         tenant = self.get_tenant(tenant_id)
         self.validate_permissions(tenant)
         authenticator = GraphAuthenticator(tenant, self.audit)
-        graph_client = GraphClient(tenant_config=tenant, authenticator=authenticator, audit_logger=self.audit)
-        return TenantExecutionContext(tenant_id=tenant.tenant_id, graph=graph_client)
+        graph_client = GraphClient(
+            tenant_config=tenant,
+            authenticator=authenticator,
+            audit_logger=self.audit,
+            session=self.http,
+        )
+        context = TenantExecutionContext(tenant_id=tenant.tenant_id, graph=graph_client)
+        self._context_cache[tenant.tenant_id] = context
+        return context
 
     def run_operation(
         self,
@@ -57,10 +112,62 @@ class TenantManager:
         operation: Callable[[TenantOperations], object],
         correlation_id: Optional[str] = None,
     ) -> object:
-        correlation_id = correlation_id or str(uuid.uuid4())
+        correlation_id = correlation_id or secrets.token_hex(8)
         context = self.with_context(tenant_id)
         self.audit.info("operation_started", tenant_id=tenant_id, correlation_id=correlation_id)
         ops = TenantOperations(context)
         result = operation(ops)
         self.audit.info("operation_completed", tenant_id=tenant_id, correlation_id=correlation_id)
         return result
+
+    async def run_operation_async(
+        self,
+        tenant_id: str,
+        operation: Callable[[TenantOperations], Awaitable[object]],
+        correlation_id: Optional[str] = None,
+        http: Optional[httpx.AsyncClient] = None,
+    ) -> object:
+        """Async counterpart of ``run_operation``.
+
+        Requests go through ``http`` when given; otherwise a client is opened for
+        this call and closed when it finishes.
+        """
+        if http is None:
+            async with self._async_http() as http:
+                return await self.run_operation_async(tenant_id, operation, correlation_id, http)
+
+        correlation_id = correlation_id or secrets.token_hex(8)
+        context = self.with_context(tenant_id)
+        context = replace(context, graph=context.graph.with_async_session(http))
+        self.audit.info("operation_started", tenant_id=tenant_id, correlation_id=correlation_id)
+        ops = TenantOperations(context)
+        result = await operation(ops)
+        self.audit.info("operation_completed", tenant_id=tenant_id, correlation_id=correlation_id)
+        return result
+
+    async def run_on_all_tenants(
+        self,
+        operation: Callable[[TenantOperations], Awaitable[object]],
+        http: Optional[httpx.AsyncClient] = None,
+    ) -> Dict[str, object]:
+        """Run ``operation`` against every configured tenant concurrently.
+
+        Each tenant gets its own context and correlation ID. Results are keyed by
+        tenant ID; a tenant whose operation raised maps to the exception instead, so
+        one failing tenant does not discard the others' results. As with
+        ``run_operation_async``, requests go through ``http`` when given; otherwise
+        a client is opened for this call and closed when it finishes.
+        """
+        if http is None:
+            async with self._async_http() as http:
+                return await self.run_on_all_tenants(operation, http)
+
+        tenant_ids = list(self._tenant_cache)
+        results = await asyncio.gather(
+            *(self.run_operation_async(tenant_id, operation, http=http) for tenant_id in tenant_ids),
+            return_exceptions=True,
+        )
+        for tenant_id, result in zip(tenant_ids, results):
+            if isinstance(result, BaseException):
+                self.audit.error("operation_failed", tenant_id=tenant_id, error=repr(result))
+        return dict(zip(tenant_ids, results))
@@ -0,0 +1,50 @@
+import logging
+import sys
+from pathlib import Path
+from typing import Callable, List
+
+import httpx
+import pytest
+
+# The package lives under src/ and is not installed; mirror PYTHONPATH=src.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from control_plane.audit import JsonAuditLogger  # noqa: E402
+from control_plane.config import TenantConfig  # noqa: E402
+from control_plane.graph_client import GraphClient  # noqa: E402
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeAuthenticator:
+    """Stands in for GraphAuthenticator and records each token request."""
+
+    def __init__(self) -> None:
+        self.calls: List[bool] = []
+
+    def acquire_token(self, scopes, force_refresh: bool = False) -> str:
+        self.calls.append(force_refresh)
+        return f"token-{len(self.calls)}"
+
+
+@pytest.fixture
+def audit_logger() -> JsonAuditLogger:
+    return JsonAuditLogger(level=logging.CRITICAL)
+
+
+@pytest.fixture
+def make_graph_client(audit_logger) -> Callable[..., GraphClient]:
+    """Build a GraphClient whose sync and async sessions are served by ``handler``."""
+
+    def factory(handler: Handler, max_retries: int = 3, tenant_id: str = "tenant-a") -> GraphClient:
+        transport = httpx.MockTransport(handler)
+        return GraphClient(
+            tenant_config=TenantConfig(tenant_id=tenant_id, auth={"type": "managed_identity"}),
+            authenticator=FakeAuthenticator(),
+            audit_logger=audit_logger,
+            max_retries=max_retries,
+            session=httpx.Client(transport=transport),
+            async_session=httpx.AsyncClient(transport=transport),
+        )
+
+    return factory
@@ -0,0 +1,136 @@
+import sys
+import threading
+import types
+from typing import Any, Dict, List
+
+import pytest
+
+from control_plane import auth as auth_module
+from control_plane.auth import TOKEN_REFRESH_MARGIN_SECONDS, GraphAuthenticator
+from control_plane.config import TenantConfig
+
+SCOPES = ["https://graph.microsoft.com/.default"]
+
+
+class StubMsal:
+    """Minimal stand-in for the msal module that records what it is asked to do."""
+
+    def __init__(self) -> None:
+        self.apps: List["StubMsal.App"] = []
+        self.expires_in = 3600
+        self.on_construct = lambda: None
+        stub = self
+
+        class App:
+            def __init__(self, **kwargs: Any) -> None:
+                stub.on_construct()
+                self.kwargs = kwargs
+                self.token_requests = 0
+                stub.apps.append(self)
+
+            def acquire_token_silent(self, scopes, account=None):
+                return None
+
+            def acquire_token_for_client(self, scopes) -> Dict[str, Any]:
+                self.token_requests += 1
+                return {
+                    "access_token": f"token-{len(stub.apps)}-{self.token_requests}",
+                    "expires_in": stub.expires_in,
+                }
+
+        self.ConfidentialClientApplication = App
+
+
+@pytest.fixture
+def msal_stub(monkeypatch) -> StubMsal:
+    stub = StubMsal()
+    module = types.SimpleNamespace(ConfidentialClientApplication=stub.ConfidentialClientApplication)
+    monkeypatch.setitem(sys.modules, "msal", module)
+    # Start every test with empty process-wide caches.
+    monkeypatch.setattr(auth_module, "_APP_CACHE", {})
+    monkeypatch.setattr(auth_module, "_TOKEN_CACHE", {})
+    monkeypatch.setattr(auth_module, "_KEY_LOCKS", {})
+    return stub
+
+
+@pytest.fixture
+def make_authenticator(monkeypatch, audit_logger):
+    def factory(tenant_id: str = "tenant-a", secret: str = "secret-1") -> GraphAuthenticator:
+        env_name = f"TEST_SECRET_{tenant_id.upper().replace('-', '_')}"
+        monkeypatch.setenv(env_name, secret)
+        tenant = TenantConfig(
+            tenant_id=tenant_id,
+            auth={"type": "client_secret", "client_id": "client", "client_secret": {"env": env_name}},
+        )
+        return GraphAuthenticator(tenant, audit_logger)
+
+    return factory
+
+
+def test_cached_token_is_returned_without_calling_msal(msal_stub, make_authenticator):
+    authenticator = make_authenticator()
+
+    first = authenticator.acquire_token(SCOPES)
+    second = authenticator.acquire_token(SCOPES)
+
+    assert first == second
+    assert len(msal_stub.apps) == 1
+    assert msal_stub.apps[0].token_requests == 1
+
+
+def test_token_within_refresh_margin_is_renewed(msal_stub, make_authenticator):
+    msal_stub.expires_in = TOKEN_REFRESH_MARGIN_SECONDS - 1
+    authenticator = make_authenticator()
+
+    first = authenticator.acquire_token(SCOPES)
+    second = authenticator.acquire_token(SCOPES)
+
+    assert first != second
+    # The same MSAL application (and its token cache) is reused for the renewal.
+    assert len(msal_stub.apps) == 1
+    assert msal_stub.apps[0].token_requests == 2
+
+
+def test_force_refresh_rebuilds_the_app(msal_stub, make_authenticator):
+    authenticator = make_authenticator()
+
+    first = authenticator.acquire_token(SCOPES)
+    second = authenticator.acquire_token(SCOPES, force_refresh=True)
+
+    assert first != second
+    assert len(msal_stub.apps) == 2
+
+
+def test_rotated_secret_rebuilds_the_app(msal_stub, make_authenticator, monkeypatch):
+    msal_stub.expires_in = TOKEN_REFRESH_MARGIN_SECONDS - 1
+    authenticator = make_authenticator(secret="secret-1")
+    authenticator.acquire_token(SCOPES)
+
+    monkeypatch.setenv("TEST_SECRET_TENANT_A", "secret-2")
+    authenticator.acquire_token(SCOPES)
+
+    assert [app.kwargs["client_credential"] for app in msal_stub.apps] == ["secret-1", "secret-2"]
+
+
+def test_tenants_build_apps_concurrently(msal_stub, make_authenticator):
+    # Both constructors must be in flight at once to pass the barrier; a lock held
+    # across construction would serialize them and break it.
+    barrier = threading.Barrier(2, timeout=5)
+    msal_stub.on_construct = barrier.wait
+    authenticators = [make_authenticator("tenant-a"), make_authenticator("tenant-b")]
+    errors: List[BaseException] = []
+
+    def acquire(authenticator: GraphAuthenticator) -> None:
+        try:
+            authenticator.acquire_token(SCOPES)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=acquire, args=(a,)) for a in authenticators]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(msal_stub.apps) == 2
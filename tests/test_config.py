@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from control_plane import config as config_module
+from control_plane.config import ControlPlaneConfig
+
+CONFIG_YAML = """
+tenants:
+  - tenant_id: "tenant-a"
+    auth:
+      type: "managed_identity"
+"""
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    original = config_module._parse_yaml
+
+    def counting_parse(data):
+        calls.append(data)
+        return original(data)
+
+    monkeypatch.setattr(config_module, "_parse_yaml", counting_parse)
+    return calls
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_unchanged_file_returns_cached_config(tmp_path, parse_calls):
+    path = tmp_path / "tenants.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+
+    first = ControlPlaneConfig.load(path)
+    second = ControlPlaneConfig.load(path)
+
+    assert second is first
+    assert len(parse_calls) == 1
+
+
+def test_touched_file_with_identical_bytes_reuses_config(tmp_path, parse_calls):
+    path = tmp_path / "tenants.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    first = ControlPlaneConfig.load(path)
+
+    bump_mtime(path)
+    second = ControlPlaneConfig.load(path)
+
+    assert second is first
+    assert len(parse_calls) == 1
+
+
+def test_changed_file_is_reloaded(tmp_path, parse_calls):
+    path = tmp_path / "tenants.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    first = ControlPlaneConfig.load(path)
+
+    path.write_text(CONFIG_YAML.replace("tenant-a", "tenant-b"), encoding="utf-8")
+    bump_mtime(path)
+    second = ControlPlaneConfig.load(path)
+
+    assert second is not first
+    assert [tenant.tenant_id for tenant in second.tenants] == ["tenant-b"]
+    assert len(parse_calls) == 2
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ControlPlaneConfig.load(tmp_path / "missing.yaml")
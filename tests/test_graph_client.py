@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List
+
+import httpx
+import pytest
+
+from control_plane import graph_client as graph_client_module
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> List[float]:
+    recorded: List[float] = []
+    monkeypatch.setattr(graph_client_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_final_throttled_response_raises_without_sleeping(sleeps, make_graph_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "2"})
+
+    client = make_graph_client(handler, max_retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        client.get("/v1.0/users")
+
+    assert excinfo.value.response.status_code == 429
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_no_retries_raises_throttle_immediately(sleeps, make_graph_client):
+    client = make_graph_client(lambda request: httpx.Response(503), max_retries=0)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get("/v1.0/users")
+
+    assert sleeps == []
+
+
+def test_unauthorized_refreshes_token_once_without_using_an_attempt(sleeps, make_graph_client):
+    seen_tokens = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_tokens.append(request.headers["Authorization"])
+        if len(seen_tokens) == 1:
+            return httpx.Response(401)
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_graph_client(handler, max_retries=0)
+
+    response = client.get("/v1.0/users")
+
+    assert response.json() == {"ok": True}
+    assert seen_tokens == ["Bearer token-1", "Bearer token-2"]
+    assert client.authenticator.calls == [False, True]
+    assert sleeps == []
+
+
+def test_repeated_unauthorized_raises(sleeps, make_graph_client):
+    client = make_graph_client(lambda request: httpx.Response(401))
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        client.get("/v1.0/users")
+
+    assert excinfo.value.response.status_code == 401
+    assert client.authenticator.calls == [False, True]
+
+
+def http_date(offset: timedelta) -> str:
+    return format_datetime(datetime.now(timezone.utc) + offset, usegmt=True)
+
+
+def test_retry_after_accepts_http_date(make_graph_client):
+    client = make_graph_client(lambda request: httpx.Response(200))
+    response = httpx.Response(429, headers={"Retry-After": http_date(timedelta(seconds=30))})
+
+    delay = client._get_retry_after_seconds(response)
+
+    assert delay is not None
+    assert 28 <= delay <= 30
+
+
+def test_retry_after_in_the_past_falls_back_to_backoff(sleeps, make_graph_client):
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": http_date(timedelta(minutes=-5))}),
+            httpx.Response(200),
+        ]
+    )
+    client = make_graph_client(lambda request: next(responses))
+
+    assert client._get_retry_after_seconds(
+        httpx.Response(429, headers={"Retry-After": http_date(timedelta(minutes=-5))})
+    ) == 0.0
+
+    client.get("/v1.0/users")
+
+    # Initial backoff of 1s plus up to 25% jitter.
+    assert len(sleeps) == 1
+    assert 1.0 <= sleeps[0] <= 1.25
+
+
+def test_retry_after_seconds_get_bounded_jitter(sleeps, make_graph_client):
+    responses = iter([httpx.Response(503, headers={"Retry-After": "2"}), httpx.Response(200)])
+    client = make_graph_client(lambda request: next(responses))
+
+    client.get("/v1.0/users")
+
+    assert len(sleeps) == 1
+    assert 2.0 <= sleeps[0] <= 2.5
+
+
+@pytest.mark.parametrize("value", ["soon", "-5", "inf", "nan"])
+def test_malformed_retry_after_is_ignored(make_graph_client, value):
+    client = make_graph_client(lambda request: httpx.Response(200))
+    response = httpx.Response(429, headers={"Retry-After": value})
+
+    assert client._get_retry_after_seconds(response) is None
+
+
+def test_negative_retry_after_falls_back_to_backoff(sleeps, make_graph_client):
+    responses = iter([httpx.Response(429, headers={"Retry-After": "-5"}), httpx.Response(200)])
+    client = make_graph_client(lambda request: next(responses))
+
+    client.get("/v1.0/users")
+
+    assert len(sleeps) == 1
+    assert 1.0 <= sleeps[0] <= 1.25
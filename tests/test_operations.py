@@ -0,0 +1,84 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from control_plane.operations import MAX_USERS_PAGE_SIZE, TenantExecutionContext, TenantOperations
+
+BASE_URL = "https://graph.microsoft.com"
+
+
+def paged_users(requests: List[httpx.Request], pages: int = 3, page_size: int = 2):
+    """Serve ``pages`` pages of users linked by @odata.nextLink."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params.get("page", "0"))
+        body = {"value": [{"id": f"user-{page}-{i}"} for i in range(page_size)]}
+        if page + 1 < pages:
+            body["@odata.nextLink"] = f"{BASE_URL}/v1.0/users?page={page + 1}"
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+@pytest.fixture
+def make_operations(make_graph_client):
+    def factory(handler) -> TenantOperations:
+        graph = make_graph_client(handler)
+        return TenantOperations(TenantExecutionContext(tenant_id=graph.tenant_config.tenant_id, graph=graph))
+
+    return factory
+
+
+def test_list_users_stops_at_top_across_pages(make_operations):
+    requests: List[httpx.Request] = []
+    ops = make_operations(paged_users(requests))
+
+    users = ops.list_users(top=3)
+
+    assert [user["id"] for user in users] == ["user-0-0", "user-0-1", "user-1-0"]
+    # The third page is never fetched.
+    assert len(requests) == 2
+    assert requests[0].url.params["$top"] == "3"
+
+
+def test_iter_users_follows_next_link_to_the_end(make_operations):
+    requests: List[httpx.Request] = []
+    ops = make_operations(paged_users(requests))
+
+    users = list(ops.iter_users(page_size=2))
+
+    assert len(users) == 6
+    assert len(requests) == 3
+
+
+def test_list_users_async_stops_at_top_across_pages(make_operations):
+    requests: List[httpx.Request] = []
+    ops = make_operations(paged_users(requests))
+
+    users = asyncio.run(ops.list_users_async(top=3))
+
+    assert [user["id"] for user in users] == ["user-0-0", "user-0-1", "user-1-0"]
+    assert len(requests) == 2
+
+
+def test_large_top_is_paged_with_capped_page_size(make_operations):
+    requests: List[httpx.Request] = []
+    ops = make_operations(paged_users(requests, pages=1))
+
+    ops.list_users(top=5000)
+    asyncio.run(ops.list_users_async(top=5000))
+
+    assert [request.url.params["$top"] for request in requests] == [str(MAX_USERS_PAGE_SIZE)] * 2
+
+
+@pytest.mark.parametrize("top", [0, -1])
+def test_non_positive_top_returns_no_users(make_operations, top):
+    requests: List[httpx.Request] = []
+    ops = make_operations(paged_users(requests))
+
+    assert ops.list_users(top=top) == []
+    assert asyncio.run(ops.list_users_async(top=top)) == []
+    assert requests == []
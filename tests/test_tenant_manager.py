@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+from conftest import FakeAuthenticator
+
+from control_plane.audit import InMemoryAuditStore, JsonAuditLogger
+from control_plane.config import ControlPlaneConfig
+from control_plane.tenant_manager import TenantManager
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "graph.failing.example":
+        return httpx.Response(403, json={"error": {"code": "Authorization_RequestDenied"}})
+    return httpx.Response(200, json={"value": [{"id": "user-1"}]})
+
+
+@pytest.fixture
+def audit_store() -> InMemoryAuditStore:
+    return InMemoryAuditStore()
+
+
+@pytest.fixture
+def manager(audit_store):
+    config = ControlPlaneConfig(
+        tenants=[
+            {"tenant_id": "tenant-ok", "auth": {"type": "managed_identity"}},
+            {
+                "tenant_id": "tenant-failing",
+                "auth": {"type": "managed_identity"},
+                "graph_base_url": "https://graph.failing.example",
+            },
+        ]
+    )
+    with TenantManager(config, audit_logger=JsonAuditLogger(level=logging.CRITICAL, store=audit_store)) as manager:
+        for tenant in config.tenants:
+            manager.with_context(tenant.tenant_id).graph.authenticator = FakeAuthenticator()
+        yield manager
+
+
+async def fan_out(manager: TenantManager):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        return await manager.run_on_all_tenants(lambda ops: ops.list_users_async(top=1), http=http)
+
+
+def test_failing_tenant_does_not_drop_other_results(manager, audit_store):
+    results = asyncio.run(fan_out(manager))
+
+    assert results["tenant-ok"] == [{"id": "user-1"}]
+    assert isinstance(results["tenant-failing"], httpx.HTTPStatusError)
+    assert results["tenant-failing"].response.status_code == 403
+    failures = [event for event in audit_store.list() if event.message == "operation_failed"]
+    assert [event.tenant_id for event in failures] == ["tenant-failing"]
+
+
+def test_fan_out_runs_again_on_a_new_event_loop(manager):
+    first = asyncio.run(fan_out(manager))
+    second = asyncio.run(fan_out(manager))
+
+    assert first["tenant-ok"] == second["tenant-ok"] == [{"id": "user-1"}]
+
+
+def test_run_operation_async_uses_the_given_client(manager):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await manager.run_operation_async(
+                "tenant-ok", lambda ops: ops.list_users_async(top=1), http=http
+            )
+
+    assert asyncio.run(run()) == [{"id": "user-1"}]
@@ -1,18 +1,36 @@
 from __future__ import annotations
 
 import os
-import uuid
+import secrets
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List
 
-from flask import Flask, jsonify, redirect, render_template, request, url_for, flash
+from flask import Flask, redirect, render_template, request, url_for, flash
 
-from control_plane.audit import InMemoryAuditStore, JsonAuditLogger
+from control_plane.audit import InMemoryAuditStore, JsonAuditLogger, json_dumps
 from control_plane.config import ControlPlaneConfig
 from control_plane.tenant_manager import TenantManager
 
+_AUDIT_EVENT_FIELDS = ("timestamp", "level", "message", "tenant_id", "correlation_id", "extra")
+_audit_event_values = attrgetter(*_AUDIT_EVENT_FIELDS)
+
+# Apps already built in this process, keyed by resolved config path.
+_APPS: Dict[str, Flask] = {}
+
 
 def create_app(config_path: str | os.PathLike[str] = "config/tenants.yaml") -> Flask:
+    """Build the Flask app, or return the one already built for ``config_path``.
+
+    Reusing the app keeps a single TenantManager (and its HTTP pools, MSAL caches
+    and audit buffer) per process. Run under ``gunicorn --preload`` so the app is
+    built once before workers fork.
+    """
+    app_key = str(Path(config_path).resolve())
+    existing = _APPS.get(app_key)
+    if existing is not None:
+        return existing
+
     config = ControlPlaneConfig.load(Path(config_path))
     audit_store = InMemoryAuditStore()
     audit_logger = JsonAuditLogger(store=audit_store)
@@ -32,7 +50,7 @@ def create_app(config_path: str | os.PathLike[str] = "config/tenants.yaml") -> F
     def operate() -> str:
         tenant_id = request.form.get("tenant_id")
         operation = request.form.get("operation")
-        correlation_id = str(uuid.uuid4())
+        correlation_id = secrets.token_hex(8)
         result: Dict[str, Any] | List[Dict[str, Any]] | None = None
 
         if not tenant_id or not operation:
@@ -93,19 +111,13 @@ def create_app(config_path: str | os.PathLike[str] = "config/tenants.yaml") -> F
         except ValueError:
             limit = 100
         events = audit_store.list(limit=limit)
-        payload = [
-            {
-                "timestamp": event.timestamp,
-                "level": event.level,
-                "message": event.message,
-                "tenant_id": event.tenant_id,
-                "correlation_id": event.correlation_id,
-                "extra": event.extra,
-            }
-            for event in events
-        ]
-        return jsonify({"events": payload, "count": len(payload)})
+        payload = [dict(zip(_AUDIT_EVENT_FIELDS, _audit_event_values(event))) for event in events]
+        return app.response_class(
+            json_dumps({"events": payload, "count": len(payload)}),
+            mimetype="application/json",
+        )
 
+    _APPS[app_key] = app
     return app
 
 